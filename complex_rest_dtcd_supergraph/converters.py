@@ -11,6 +11,9 @@ from .structures import Content, Edge, Group, Port, Vertex
 from .utils import savable_as_property
 
 
+_ID_GETTER = itemgetter(KEYS.yfiles_id)
+
+
 class GraphDataConverter:
     """Supports conversion between front-end data and internal classes."""
 
@@ -44,7 +47,7 @@ class GraphDataConverter:
         uid = meta.pop(KEYS.yfiles_id)
         properties = self._extract_savable_properties(meta.get(KEYS.properties, {}))
         ports = meta.pop(KEYS.init_ports, [])  #  save only ids
-        port_ids = set(map(itemgetter(KEYS.yfiles_id), ports))
+        port_ids = set(map(_ID_GETTER, ports))
 
         return Vertex(uid=uid, properties=properties, meta=meta, ports=port_ids)
 
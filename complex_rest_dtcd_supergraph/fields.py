@@ -19,6 +19,13 @@ class ContainsOrFailMixin:
         if key not in data:
             self.fail("key_error", value=key)
 
+    def _contains_all_or_fail(self, data: dict, keys: tuple, required: frozenset):
+        missing = required.difference(data)
+
+        if missing:
+            # report the first missing key in declared order
+            self.fail("key_error", value=next(k for k in keys if k in missing))
+
 
 class CustomUUIDFIeld(UUIDField):
     """A field that ensures the input is a valid UUID string.
@@ -68,11 +75,10 @@ class EdgeField(ContainsOrFailMixin, DictField):
         KEYS.source_port,
         KEYS.target_port,
     )
+    required_keys = frozenset(keys)
 
     def to_internal_value(self, data):
         data = super().to_internal_value(data)
-
-        for key in self.keys:
-            self._contains_or_fail(data, key)
+        self._contains_all_or_fail(data, self.keys, self.required_keys)
 
         return data
@@ -8,7 +8,7 @@ and isolate details and complexity.
 from collections import defaultdict
 from dataclasses import dataclass
 from itertools import chain
-from typing import Iterable, List, Mapping, Sequence
+from typing import Iterable, List, Sequence
 
 import neomodel
 
@@ -182,41 +182,50 @@ class _Merger:
         return models.Port.create_or_update(*data)
 
     @staticmethod
-    def _merge_edges(
-        edges: Iterable[structures.Edge],
-        uid2port: Mapping[structures.ID, models.Port],
-    ) -> List[models.EdgeRel]:
-        relations = []
-
-        for edge in edges:
-            output_port = uid2port[edge.start]
-            input_port = uid2port[edge.end]
-            rel = connect_if_not_connected(output_port.neighbor, input_port)
-            rel.meta_ = edge.meta  # over-write metadata
-            rel.save()
-            relations.append(rel)
-
-        return relations
+    def _merge_edges(edges: Iterable[structures.Edge]) -> List[models.EdgeRel]:
+        # one round-trip for all edges instead of one per edge
+        # deflate metadata through the model to store it as EdgeRel.save() would
+        meta_property = models.EdgeRel.defined_properties()["meta_"]
+        data = [
+            {
+                "start": edge.start,
+                "end": edge.end,
+                "meta": meta_property.deflate(edge.meta),
+            }
+            for edge in edges
+        ]
+        results, _ = neomodel.db.cypher_query(
+            query=(
+                "UNWIND $list AS edge "
+                "MATCH (src:Port {uid: edge.start}), (dst:Port {uid: edge.end}) "
+                f"MERGE (src) -[r:{RELATION_TYPES.edge}]-> (dst) "
+                "SET r.meta_ = edge.meta "  # over-write metadata
+                "RETURN r"
+            ),
+            params={"list": data},
+        )
+
+        return [models.EdgeRel.inflate(row[0]) for row in results]
 
     @staticmethod
-    def _merge_vertices(
-        vertices: Iterable[structures.Vertex],
-        uid2port: Mapping[structures.ID, models.Port],
-    ) -> List[models.Vertex]:
-        nodes = []
+    def _merge_vertices(vertices: Sequence[structures.Vertex]) -> List[models.Vertex]:
+        # FIXME possible clash between user-defined property name and uid/meta_ key
+        data = [
+            dict(uid=vertex.uid, meta_=vertex.meta, **vertex.properties)
+            for vertex in vertices
+        ]
+        nodes = models.Vertex.create_or_update(*data, lazy=True)
 
-        for vertex in vertices:
-            # FIXME possible clash between user-defined property name and uid/meta_ key
-            node = models.Vertex.create_or_update(
-                dict(uid=vertex.uid, meta_=vertex.meta, **vertex.properties),
-                lazy=True,
-            )[0]
-            nodes.append(node)
-
-            # connect this vertex to ports
-            for uid in vertex.ports:
-                port = uid2port[uid]
-                connect_if_not_connected(node.ports, port)
+        # connect vertices to ports in one round-trip
+        pairs = [[vertex.uid, uid] for vertex in vertices for uid in vertex.ports]
+        neomodel.db.cypher_query(
+            query=(
+                "UNWIND $list AS pair "
+                "MATCH (v:Vertex {uid: pair[0]}), (p:Port {uid: pair[1]}) "
+                f"MERGE (v) -[:{RELATION_TYPES.default}]-> (p)"
+            ),
+            params={"list": pairs},
+        )
 
         return nodes
 
@@ -230,9 +239,8 @@ class _Merger:
         """Merge content entities."""
 
         ports = self._merge_ports(content.ports)
-        uid2port = {port.uid: port for port in ports}
-        edges = self._merge_edges(content.edges, uid2port)
-        vertices = self._merge_vertices(content.vertices, uid2port)
+        edges = self._merge_edges(content.edges)
+        vertices = self._merge_vertices(content.vertices)
         groups = self._merge_groups(content.groups)
 
         return self.MergedResult(
@@ -72,8 +72,12 @@ class Vertex(AbstractPrimitive):
     def clear(self):
         """Delete all connected ports."""
 
-        for port in self.ports.all():
-            port.delete()
+        q = (
+            "MATCH (this) WHERE id(this)=$id "
+            f"MATCH (this) -[:{RELATION_TYPES.default}]-> (p:Port) "
+            "DETACH DELETE p"
+        )
+        db.cypher_query(q, {"id": self.id})
 
 
 class Group(AbstractPrimitive):
@@ -110,11 +114,15 @@ class Container(StructuredNode):
     def clear(self):
         """Delete all related vertices and groups in a cascading fashion."""
 
-        for vertex in self.vertices.all():
-            vertex.delete(cascade=True)
-
-        for group in self.groups.all():
-            group.delete()
+        # single round-trip: vertices with their ports, and groups
+        q = (
+            "MATCH (this) WHERE id(this)=$id "
+            f"MATCH (this) -[:{RELATION_TYPES.contains}]-> (n) "
+            "WHERE n:Vertex OR n:Group "
+            f"OPTIONAL MATCH (n) -[:{RELATION_TYPES.default}]-> (p:Port) "
+            "DETACH DELETE n, p"
+        )
+        db.cypher_query(q, {"id": self.id})
 
     @property
     def edges(self) -> List[Tuple[Port, EdgeRel, Port]]:
@@ -2,16 +2,18 @@
 Relationship classes for neomodel.
 """
 
-from types import SimpleNamespace
+from collections import namedtuple
 
 from neomodel import JSONProperty, StructuredRel
 
 
 # settings
-RELATION_TYPES = SimpleNamespace()
-RELATION_TYPES.contains = "CONTAINS"
-RELATION_TYPES.default = "CONN"  # TODO better name?
-RELATION_TYPES.edge = "EDGE"
+_RelationTypes = namedtuple("_RelationTypes", ["contains", "default", "edge"])
+RELATION_TYPES = _RelationTypes(
+    contains="CONTAINS",
+    default="CONN",  # TODO better name?
+    edge="EDGE",
+)
 
 
 class EdgeRel(StructuredRel):
@@ -0,0 +1,23 @@
+"""
+Custom DRF parsers.
+"""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class ORJSONParser(BaseParser):
+    """Parses JSON-serialized data with `orjson`.
+
+    A faster alternative to DRF's `JSONParser` on large graph payloads.
+    Unlike `json`, `orjson` parses integers beyond 64 bits as floats.
+    """
+
+    media_type = "application/json"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
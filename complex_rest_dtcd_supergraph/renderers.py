@@ -0,0 +1,34 @@
+"""
+Custom DRF renderers.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Renders data into JSON with `orjson`.
+
+    A faster alternative to DRF's `JSONRenderer` on large graph payloads.
+    Types `orjson` does not know about (lazy translation strings,
+    decimals, etc.) go through DRF's JSON encoder. Data `orjson` cannot
+    encode at all, such as integers beyond 64 bits stored in metadata,
+    is rendered with DRF's `JSONRenderer` instead.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        try:
+            return orjson.dumps(
+                data, default=self.encoder.default, option=orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            return JSONRenderer().render(data, accepted_media_type, renderer_context)
@@ -4,7 +4,7 @@ Custom DRF serializers.
 
 from itertools import chain
 from operator import itemgetter
-from types import SimpleNamespace
+from typing import Hashable, Iterable
 
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
@@ -14,6 +14,31 @@ from .models import Container, Fragment, Root
 from .settings import KEYS
 
 
+# flat key constants and pre-built getters for validation
+_ID = KEYS.yfiles_id
+_PARENT_ID = KEYS.parent_id
+_INIT_PORTS = KEYS.init_ports
+_NODE_ID_GETTER = itemgetter(_ID)
+_EDGE_ID_GETTER = itemgetter(
+    KEYS.source_node, KEYS.target_node, KEYS.source_port, KEYS.target_port
+)
+_EDGE_SRC_NODE_GETTER = itemgetter(KEYS.source_node)
+_EDGE_TGT_NODE_GETTER = itemgetter(KEYS.target_node)
+_EDGE_SRC_PORT_GETTER = itemgetter(KEYS.source_port)
+_EDGE_TGT_PORT_GETTER = itemgetter(KEYS.target_port)
+_EDGE_NODES_GETTER = itemgetter(KEYS.source_node, KEYS.target_node)
+_EDGE_PORTS_GETTER = itemgetter(KEYS.source_port, KEYS.target_port)
+
+
+def _first_missing(pairs: Iterable[tuple], known: set):
+    """Return the first ID from pairs of edge endpoints that is not known.
+
+    Keeps error messages stable by following payload order.
+    """
+
+    return next(id_ for pair in pairs for id_ in pair if id_ not in known)
+
+
 class ContainerSerializer(serializers.Serializer):
     id = CustomUUIDFIeld(read_only=True, source="uid")
     name = serializers.CharField(max_length=255)  # TODO value in settings
@@ -55,98 +80,82 @@ class ContentSerializer(serializers.Serializer):
         "self_reference": _("A group with id [{value}] has a self-reference."),
     }
 
-    keys = SimpleNamespace(
-        id=KEYS.yfiles_id,
-        src_node=KEYS.source_node,
-        tgt_node=KEYS.target_node,
-        src_port=KEYS.source_port,
-        tgt_port=KEYS.target_port,
-        parent_id=KEYS.parent_id,
-        init_ports=KEYS.init_ports,
-    )
-
     nodes = serializers.ListField(child=VertexField())
     edges = serializers.ListField(child=EdgeField())
     groups = serializers.ListField(child=GroupField())
 
     # TODO validate uniqueness of all IDs
 
-    def validate_nodes(self, value):
-        ids = set(map(itemgetter(self.keys.id), value))
-
-        if len(ids) != len(value):
-            self.fail("not_unique")
-
-        # TODO validate ports
+    def validate_edges(self, value):
+        self._unique_ids(map(_EDGE_ID_GETTER, value))
 
         return value
 
-    def validate_edges(self, value):
-        keys = (
-            self.keys.src_node,
-            self.keys.tgt_node,
-            self.keys.src_port,
-            self.keys.tgt_port,
-        )
-        ids = set(map(itemgetter(*keys), value))
-
-        if len(ids) != len(value):
-            self.fail("not_unique")
+    def validate(self, data: dict):
+        # unique node and group IDs, re-used for reference checks
+        # TODO validate ports
+        node_ids = self._unique_ids(map(_NODE_ID_GETTER, data["nodes"]))
+        group_ids = self._unique_ids(map(_NODE_ID_GETTER, data.get("groups", [])))
+        self._validate_no_self_reference(data)
+        self._validate_references(data, node_ids)
+        self._validate_parent_groups_exist(data, group_ids)
 
-        return value
+        return data
 
-    def validate_groups(self, value):
-        # unique IDs
-        value = self.validate_nodes(value)
+    def _unique_ids(self, ids: Iterable[Hashable]) -> set:
+        """Consume an iterable of IDs and return them as a set.
 
-        # no self-reference
-        for obj in value:
-            id_ = obj[self.keys.id]
-            parent_id = obj.get(self.keys.parent_id)
+        Fails on the first ID that is not unique.
+        """
 
-            if parent_id == id_:
-                self.fail("self_reference", value=id_)
+        seen = set()
+        add = seen.add
 
-        return value
+        for id_ in ids:
+            if id_ in seen:
+                self.fail("not_unique")
+            add(id_)
 
-    def validate(self, data: dict):
-        self._validate_references(data)
-        self._validate_parent_groups_exist(data)
+        return seen
 
-        return data
+    def _validate_no_self_reference(self, data: dict):
+        for obj in data.get("groups", []):
+            # most groups have no parent, skip the ID lookup for them
+            if (parent_id := obj.get(_PARENT_ID)) is not None and parent_id == obj[_ID]:
+                self.fail("self_reference", value=parent_id)
 
-    def _validate_references(self, data: dict):
+    def _validate_references(self, data: dict, node_ids: set):
         nodes = data["nodes"]
         edges = data["edges"]
 
         # for each edge, make sure referred nodes really exist
-        node_ids = set(map(itemgetter(self.keys.id), nodes))
-        for id_ in chain.from_iterable(
-            map(itemgetter(self.keys.src_node, self.keys.tgt_node), edges)
-        ):
-            if id_ not in node_ids:
-                self.fail("does_not_exist", value=id_)
+        referred = set(map(_EDGE_SRC_NODE_GETTER, edges))
+        referred.update(map(_EDGE_TGT_NODE_GETTER, edges))
+
+        # only scan edges again to report a missing ID
+        if not referred.issubset(node_ids):
+            missing = _first_missing(map(_EDGE_NODES_GETTER, edges), node_ids)
+            self.fail("does_not_exist", value=missing)
 
         # for each edge, make sure referred ports really exist
-        port_ids = set()
-        for node in nodes:
-            for port in node.get(self.keys.init_ports, []):
-                port_ids.add(port.get(self.keys.id))
-
-        for id_ in chain.from_iterable(
-            map(itemgetter(self.keys.src_port, self.keys.tgt_port), edges)
-        ):
-            if id_ not in port_ids:
-                self.fail("does_not_exist", value=id_)
-
-    def _validate_parent_groups_exist(self, data: dict):
+        port_ids = {
+            port.get(_ID) for node in nodes for port in node.get(_INIT_PORTS, ())
+        }
+
+        referred = set(map(_EDGE_SRC_PORT_GETTER, edges))
+        referred.update(map(_EDGE_TGT_PORT_GETTER, edges))
+
+        if not referred.issubset(port_ids):
+            missing = _first_missing(map(_EDGE_PORTS_GETTER, edges), port_ids)
+            self.fail("does_not_exist", value=missing)
+
+    def _validate_parent_groups_exist(self, data: dict, group_ids: set):
         # make sure parent groups exist for vertices and groups
         groups = data.get("groups", [])
-        group_ids = set(map(itemgetter(self.keys.id), groups))
         nodes = data["nodes"]
 
         for obj in chain(groups, nodes):
-            parent_id = obj.get(self.keys.parent_id)
+            parent_id = obj.get(_PARENT_ID)
 
             if parent_id is not None and parent_id not in group_ids:
                 self.fail("does_not_exist", value=parent_id)
@@ -1,7 +1,7 @@
 import configparser
 import uuid
+from collections import namedtuple
 from pathlib import Path
-from types import SimpleNamespace
 
 import neomodel
 
@@ -28,19 +28,38 @@ config_parser = configparser.ConfigParser(allow_no_value=True)
 config_parser.read(PROJECT_DIR / "supergraph.conf")
 ini_config = merge_ini_config_with_defaults(config_parser, default_ini_config)
 
-KEYS = SimpleNamespace()
-KEYS.edges = "edges"
-KEYS.groups = "groups"
-KEYS.init_ports = "initPorts"
-KEYS.nodes = "nodes"
-KEYS.parent_id = "parentID"
-KEYS.properties = "properties"
-KEYS.source_node = "sourceNode"
-KEYS.source_port = "sourcePort"
-KEYS.target_node = "targetNode"
-KEYS.target_port = "targetPort"
-KEYS.value = "value"
-KEYS.yfiles_id = "primitiveID"
+# keys of the graph payload, frozen so they cannot be re-assigned at runtime
+_Keys = namedtuple(
+    "_Keys",
+    [
+        "edges",
+        "groups",
+        "init_ports",
+        "nodes",
+        "parent_id",
+        "properties",
+        "source_node",
+        "source_port",
+        "target_node",
+        "target_port",
+        "value",
+        "yfiles_id",
+    ],
+)
+KEYS = _Keys(
+    edges="edges",
+    groups="groups",
+    init_ports="initPorts",
+    nodes="nodes",
+    parent_id="parentID",
+    properties="properties",
+    source_node="sourceNode",
+    source_port="sourcePort",
+    target_node="targetNode",
+    target_port="targetPort",
+    value="value",
+    yfiles_id="primitiveID",
+)
 
 # neomodel
 # https://neomodel.readthedocs.io/en/latest/configuration.html
@@ -15,6 +15,8 @@ from .. import settings
 from ..converters import GraphDataConverter
 from ..managers import Manager
 from ..models import Root
+from ..parsers import ORJSONParser
+from ..renderers import ORJSONRenderer
 from ..serializers import ContentSerializer, GraphSerializer
 from .fragments import get_fragment_from_root_or_404
 from .mixins import ContainerManagementMixin
@@ -26,6 +28,8 @@ class RootGraphView(ContainerManagementMixin, APIView):
 
     http_method_names = ["get", "put", "delete"]
     permission_classes = (AllowAny,)
+    parser_classes = (ORJSONParser,)
+    renderer_classes = (ORJSONRenderer,)
     converter = GraphDataConverter()
     manager = Manager()
 
@@ -80,6 +84,8 @@ class RootFragmentGraphView(ContainerManagementMixin, APIView):
 
     http_method_names = ["get", "put", "delete"]
     permission_classes = (AllowAny,)
+    parser_classes = (ORJSONParser,)
+    renderer_classes = (ORJSONRenderer,)
     converter = GraphDataConverter()
     manager = Manager()
 
@@ -19,27 +19,35 @@ class TestVertexField(SimpleTestCase):
 
 
 class TestEdgeField(SimpleTestCase):
+    def assert_missing(self, field, data: dict, key: str):
+        """Assert that validation fails and reports the given missing key."""
+
+        with self.assertRaises(ValidationError) as cm:
+            field.to_internal_value(data)
+
+        self.assertIn(f"'{key}'", str(cm.exception.detail[0]))
+
     def test_invalid(self):
         data = {"spam": 42}
         field = EdgeField()
-
-        with self.assertRaises(ValidationError):
-            field.to_internal_value(data)
+        self.assert_missing(field, data, KEYS.source_node)
 
         # missing: end vertex, start/end ports
         data[KEYS.source_node] = "n1"
-        with self.assertRaises(ValidationError):
-            field.to_internal_value(data)
+        self.assert_missing(field, data, KEYS.target_node)
 
         # missing: start/end ports
         data[KEYS.target_node] = "n2"
-        with self.assertRaises(ValidationError):
-            field.to_internal_value(data)
+        self.assert_missing(field, data, KEYS.source_port)
 
         # missing: end port
         data[KEYS.source_port] = "p1"
-        with self.assertRaises(ValidationError):
-            field.to_internal_value(data)
+        self.assert_missing(field, data, KEYS.target_port)
+
+    def test_missing_key_order(self):
+        # missing: end vertex and start port, report in declared order
+        data = {KEYS.source_node: "n1", KEYS.target_port: "p2"}
+        self.assert_missing(EdgeField(), data, KEYS.target_node)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,31 @@
+import io
+import unittest
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+
+from complex_rest_dtcd_supergraph.parsers import ORJSONParser
+
+
+class TestORJSONParser(SimpleTestCase):
+    def test_parse(self):
+        stream = io.BytesIO(b'{"nodes": [{"primitiveID": "n1"}], "edges": []}')
+        data = ORJSONParser().parse(stream)
+        self.assertEqual(data, {"nodes": [{"primitiveID": "n1"}], "edges": []})
+
+    def test_big_integer(self):
+        # orjson limit: integers beyond 64 bits become floats
+        stream = io.BytesIO(b'{"x": 18446744073709551616}')
+        data = ORJSONParser().parse(stream)
+        self.assertIsInstance(data["x"], float)
+        self.assertEqual(data["x"], float(2**64))
+
+    def test_invalid(self):
+        stream = io.BytesIO(b'{"nodes": [')
+
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(stream)
+
+
+if __name__ == "__main__":
+    unittest.main()
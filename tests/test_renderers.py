@@ -0,0 +1,36 @@
+import json
+import unittest
+import uuid
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy as _
+
+from complex_rest_dtcd_supergraph.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer(SimpleTestCase):
+    def test_render(self):
+        uid = uuid.uuid4()
+        data = {"id": uid, "detail": _("spam"), "nodes": [{"primitiveID": "n1"}]}
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertIsInstance(rendered, bytes)
+        self.assertEqual(
+            json.loads(rendered),
+            {"id": str(uid), "detail": "spam", "nodes": [{"primitiveID": "n1"}]},
+        )
+
+    def test_render_big_integer(self):
+        # orjson cannot encode it, falls back to DRF's renderer
+        data = {"meta": {"x": 2**64}}
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertIsInstance(rendered, bytes)
+        self.assertEqual(json.loads(rendered), data)
+
+    def test_render_none(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
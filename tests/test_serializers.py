@@ -0,0 +1,114 @@
+import unittest
+
+from django.test import SimpleTestCase
+from rest_framework.settings import api_settings
+
+from complex_rest_dtcd_supergraph.serializers import ContentSerializer
+
+from .misc import KEYS
+
+
+NON_FIELD_ERRORS = api_settings.NON_FIELD_ERRORS_KEY
+
+
+def make_payload() -> dict:
+    """Return a valid payload: 2 vertices with ports, an edge and 2 groups."""
+
+    return {
+        KEYS.nodes: [
+            {
+                KEYS.yfiles_id: "amy",
+                KEYS.parent_id: "friends",
+                KEYS.init_ports: [{KEYS.yfiles_id: "mobile"}],
+            },
+            {
+                KEYS.yfiles_id: "bob",
+                KEYS.init_ports: [{KEYS.yfiles_id: "laptop"}],
+            },
+        ],
+        KEYS.edges: [
+            {
+                KEYS.source_node: "amy",
+                KEYS.source_port: "mobile",
+                KEYS.target_node: "bob",
+                KEYS.target_port: "laptop",
+            },
+        ],
+        KEYS.groups: [
+            {KEYS.yfiles_id: "people"},
+            {KEYS.yfiles_id: "friends", KEYS.parent_id: "people"},
+        ],
+    }
+
+
+class TestContentSerializer(SimpleTestCase):
+    def assert_invalid(self, data: dict, key: str, code: str):
+        """Assert that the data is invalid and return the error under the key."""
+
+        serializer = ContentSerializer(data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn(key, serializer.errors)
+        error = serializer.errors[key][0]
+        self.assertEqual(error.code, code)
+
+        return error
+
+    def test_valid(self):
+        data = make_payload()
+        serializer = ContentSerializer(data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+    def test_nodes_not_unique(self):
+        data = make_payload()
+        data[KEYS.nodes][1][KEYS.yfiles_id] = "amy"
+        self.assert_invalid(data, NON_FIELD_ERRORS, "not_unique")
+
+    def test_groups_not_unique(self):
+        data = make_payload()
+        data[KEYS.groups].append({KEYS.yfiles_id: "people"})
+        self.assert_invalid(data, NON_FIELD_ERRORS, "not_unique")
+
+    def test_edges_not_unique(self):
+        data = make_payload()
+        data[KEYS.edges].append(dict(data[KEYS.edges][0]))
+        self.assert_invalid(data, KEYS.edges, "not_unique")
+
+    def test_node_does_not_exist(self):
+        # report the first missing endpoint in payload order
+        data = make_payload()
+        edge = data[KEYS.edges][0]
+        edge[KEYS.source_node] = "ghost_c"
+        edge[KEYS.target_node] = "ghost_a"
+        error = self.assert_invalid(data, NON_FIELD_ERRORS, "does_not_exist")
+        self.assertIn("[ghost_c]", str(error))
+
+    def test_port_does_not_exist(self):
+        data = make_payload()
+        edge = data[KEYS.edges][0]
+        edge[KEYS.source_port] = "ghost_c"
+        edge[KEYS.target_port] = "ghost_a"
+        error = self.assert_invalid(data, NON_FIELD_ERRORS, "does_not_exist")
+        self.assertIn("[ghost_c]", str(error))
+
+    def test_parent_group_does_not_exist(self):
+        data = make_payload()
+        data[KEYS.nodes][1][KEYS.parent_id] = "enemies"
+        error = self.assert_invalid(data, NON_FIELD_ERRORS, "does_not_exist")
+        self.assertIn("[enemies]", str(error))
+
+    def test_self_reference(self):
+        data = make_payload()
+        data[KEYS.groups][0][KEYS.parent_id] = "people"
+        error = self.assert_invalid(data, NON_FIELD_ERRORS, "self_reference")
+        self.assertIn("[people]", str(error))
+
+    def test_no_parent_is_not_self_reference(self):
+        # a group without a parent never refers to itself, even with no ID
+        data = make_payload()
+        data[KEYS.groups].append({KEYS.yfiles_id: None})
+        serializer = ContentSerializer(data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ import dictdiffer
 import neomodel
 from django.urls import reverse
 from django.test import Client, tag
+from neo4j.exceptions import ClientError
 from rest_framework import status
 from rest_framework.test import APISimpleTestCase
 
@@ -23,7 +24,25 @@ DEBUG_FILEPATH = "debug.txt"
 
 
 def reset_db():
-    neomodel.clear_neo4j_database(neomodel.db)
+    # delete in bounded batches; fall back if APOC is not installed
+    try:
+        results, _ = neomodel.db.cypher_query(
+            "CALL apoc.periodic.iterate("
+            "'MATCH (n) RETURN n', 'DETACH DELETE n', {batchSize: 10000}) "
+            "YIELD failedBatches, errorMessages "
+            "RETURN failedBatches, errorMessages"
+        )
+    except ClientError as exc:
+        if exc.code != "Neo.ClientError.Procedure.ProcedureNotFound":
+            raise
+
+        neomodel.clear_neo4j_database(neomodel.db)
+        return
+
+    # failed batches do not raise, but leave data behind for the next test
+    failed_batches, error_messages = results[0]
+    if failed_batches > 0:
+        raise RuntimeError(f"Failed to reset the database: {error_messages}")
 
 
 class APITestCaseMixin:
@@ -515,6 +534,43 @@ class TestRootGraphView(
         # make sure 2 vertices with ports are merged, the edge is removed
         self.assert_merge_retrieve_eq(new, self.url)
 
+    def test_edges_in_both_directions(self):
+        # merge 2 vertices with edges A -> B and B -> A
+        path = DATA_DIR / "2v-1e.json"
+        data = load_data(path)
+        edge = data["edges"][0]
+        data["edges"].append(
+            {
+                "sourceNode": edge["targetNode"],
+                "sourcePort": edge["targetPort"],
+                "targetNode": edge["sourceNode"],
+                "targetPort": edge["sourcePort"],
+            }
+        )
+
+        # make sure both edges are kept as separate directed edges
+        self.assert_merge_retrieve_eq(data, self.url)
+
+    def test_replace_edge_with_reversed(self):
+        # merge 2 vertices with an edge A -> B, then replace it with B -> A
+        path = DATA_DIR / "2v-1e.json"
+        data = load_data(path)
+        self.merge(data, self.url)
+
+        new = load_data(path)
+        edge = new["edges"][0]
+        new["edges"] = [
+            {
+                "sourceNode": edge["targetNode"],
+                "sourcePort": edge["targetPort"],
+                "targetNode": edge["sourceNode"],
+                "targetPort": edge["sourcePort"],
+            }
+        ]
+
+        # make sure the old edge is removed, not re-used in reverse
+        self.assert_merge_retrieve_eq(new, self.url)
+
     @tag("slow")
     def test_n25_then_n50(self):
         # first merge